@@ -17,14 +17,23 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/1.8/howto/deployment/checklist/
+# The DJANGO_* environment variables (set in /etc/default/gsn-webui by the
+# package) override these defaults without editing any python file.
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = '4z_g+i&5omq3lbl@%*t!r1(6ag)9o619n2w@!eu0y@lg=p2gmj'
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', '4z_g+i&5omq3lbl@%*t!r1(6ag)9o619n2w@!eu0y@lg=p2gmj')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.environ.get('DJANGO_DEBUG', 'false').lower() in ('1', 'true', 'yes')
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', '*').split()
+
+# nginx sets X-Forwarded-Proto, DJANGO_HTTPS=true makes the site HTTPS only
+SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+
+SECURE_SSL_REDIRECT = os.environ.get('DJANGO_HTTPS', 'false').lower() in ('1', 'true', 'yes')
+SESSION_COOKIE_SECURE = SECURE_SSL_REDIRECT
+CSRF_COOKIE_SECURE = SECURE_SSL_REDIRECT
 
 # Application definition
 
@@ -36,12 +45,13 @@ INSTALLED_APPS = (
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'gsn',  # before staticfiles so that gsn's collectstatic command is used
     'django.contrib.staticfiles',
-    'djangobower',
-    'gsn'
     )
 
 MIDDLEWARE_CLASSES = (
+    'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -49,7 +59,6 @@ MIDDLEWARE_CLASSES = (
     'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'django.middleware.security.SecurityMiddleware',
     )
 
 ROOT_URLCONF = 'app.urls'
@@ -57,19 +66,20 @@ ROOT_URLCONF = 'app.urls'
 TEMPLATES = [{
     'BACKEND': 'django.template.backends.django.DjangoTemplates',
     'DIRS': [os.path.join(BASE_DIR, 'templates')],
-    'APP_DIRS': True,
     'OPTIONS': {
-        'context_processors': ['django.template.context_processors.debug',
-                               'django.template.context_processors.request',
+        'context_processors': ['django.template.context_processors.request',
                                'django.contrib.auth.context_processors.auth',
                                'django.contrib.messages.context_processors.messages',
                                ],
+        'loaders': ['django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                    ],
         },
     }, ]
 
-AUTHENTICATION_BACKENDS = (  # Default backend
-    'django.contrib.auth.backends.ModelBackend',  # Additional backend
-    'allaccess.backends.AuthorizedServiceBackend',
+# Users log in through the GSN services OAuth flow in gsn.views.profile
+AUTHENTICATION_BACKENDS = (
+    'django.contrib.auth.backends.ModelBackend',
     )
 
 WSGI_APPLICATION = 'app.wsgi.application'
@@ -77,31 +87,22 @@ WSGI_APPLICATION = 'app.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/1.8/ref/settings/#databases
 
-BOWER_COMPONENTS_ROOT = os.path.join(BASE_DIR, 'components')
-
-BOWER_INSTALLED_APPS = (
-    "angularjs",
-    "angular-route#^1.5.0",
-    "angular-bootstrap-datetimepicker#^1.0.1",
-    "angular-date-time-input",
-    "dirPagination#^1.0.0",
-    "angular-bootstrap#^1.1.2",
-    "bootstrap#^3.3.6",
-    "font-awesome#^4.5.0",
-    "metisMenu#^2.4.0",
-    "jquery",
-    "jquery-ui#^1.11.4",
-    "angular-tabs#^1.0.2",
-    "angular-local-storage#^0.2.3",
-    "ngmap#^1.16.7",
-    "markerclustererplus#^2.1.4",
-    "angular-chart.js#^0.9.0",
-    "highcharts#^4.2.3",
-    "highcharts-ng#^0.0.11",
-    "ngAutocomplete#^1.0.0",
-    "angular-spinner#^0.8.1",
-    "moment#^2.11.2",
-    "angular-websocket",
+# Cache
+# https://docs.djangoproject.com/en/1.8/topics/cache/
+# The local memory cache is per process, use memcached in settingsLocal when
+# running several gunicorn workers.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'KEY_PREFIX': 'gsn',
+    }
+}
+
+# Nothing in the UI uploads files, so never spool request data to temporary files
+
+FILE_UPLOAD_HANDLERS = (
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
 )
 
 # Internationalization
@@ -109,11 +110,12 @@ BOWER_INSTALLED_APPS = (
 
 LANGUAGE_CODE = 'en-us'
 
-TIME_ZONE = 'CET'
+# Values are converted to GSN['DISPLAY_TIME_ZONE'] only when they are rendered
+TIME_ZONE = 'UTC'
 
-USE_I18N = True
+USE_I18N = False
 
-USE_L10N = True
+USE_L10N = False
 
 USE_TZ = True
 
@@ -121,18 +123,32 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/1.8/howto/static-files/
 
 STATIC_URL = '/static/'
-STATIC_ROOT = './static/'
+STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
+# Vendor packages are listed in bower.json and installed with `bower install`
 STATICFILES_DIRS = (
     os.path.join(BASE_DIR, "static-files"),
+    os.path.join(BASE_DIR, "components", "bower_components"),
 )
 
 STATICFILES_FINDERS = (
     'django.contrib.staticfiles.finders.FileSystemFinder',
     'django.contrib.staticfiles.finders.AppDirectoriesFinder',
-    'djangobower.finders.BowerFinder',
 )
 
+# Files and directories of the vendor packages that are never served
+# (matched against base names, see gsn/management/commands/collectstatic.py)
+COLLECTSTATIC_IGNORE_PATTERNS = (
+    'test', 'tests', 'spec', 'docs', 'examples',
+    '*.less', '*.scss', '*.md', '*.txt',
+    'bower.json', 'package.json', 'Gruntfile.js', 'gulpfile.js', 'karma.conf.js',
+)
+
+# Collected files get a content hash in their name, so the web server can let
+# clients cache them forever (see package/templates/gsn-nginx.conf). WhiteNoise
+# also stores gzip/brotli copies and serves them itself when nginx is absent.
+STATICFILES_STORAGE = 'app.storage.SkipSourceMapsManifestStorage'
+
 # Custom setting
 
 LOGIN_URL = '/login/'
@@ -141,4 +157,19 @@ LOGIN_URL = '/login/'
 try:
     from app.settingsLocal import *
 except ImportError:
-    raise
\ No newline at end of file
+    raise
+
+# Settings derived from DEBUG, after settingsLocal so that it can still change it
+
+# Compiled templates are kept in memory, except in debug where they are reloaded when edited
+if not DEBUG:
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', TEMPLATES[0]['OPTIONS']['loaders']),
+    ]
+
+# The development server runs the finders for every static file request
+if DEBUG:
+    STATICFILES_FINDERS = (
+        'app.staticfinders.CachedFileSystemFinder',
+        'app.staticfinders.CachedAppDirectoriesFinder',
+    )
@@ -0,0 +1,12 @@
+"""
+Settings used by the package build to collect the static files.
+
+collectstatic needs neither the database nor the GSN endpoints, so the build does
+not depend on a local app/settingsLocal.py.
+"""
+import sys
+import types
+
+sys.modules['app.settingsLocal'] = types.ModuleType('app.settingsLocal')
+
+from app.settings import *
@@ -0,0 +1,32 @@
+from django.contrib.staticfiles.finders import AppDirectoriesFinder, FileSystemFinder
+
+
+class CachedFinderMixin(object):
+    """
+    Remembers the files found by find() for the lifetime of the process.
+
+    The development server looks up every static file request through the finders,
+    which stats each candidate location again and again. Misses are not remembered,
+    so a file added while the server runs is found on the next request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CachedFinderMixin, self).__init__(*args, **kwargs)
+        self._found = {}
+
+    def find(self, path, all=False):
+        key = (path, all)
+        if key not in self._found:
+            result = super(CachedFinderMixin, self).find(path, all=all)
+            if not result:
+                return result
+            self._found[key] = result
+        return self._found[key]
+
+
+class CachedFileSystemFinder(CachedFinderMixin, FileSystemFinder):
+    pass
+
+
+class CachedAppDirectoriesFinder(CachedFinderMixin, AppDirectoriesFinder):
+    pass
@@ -0,0 +1,24 @@
+from collections import OrderedDict
+
+from django.contrib.staticfiles.utils import matches_patterns
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class SkipSourceMapsManifestStorage(CompressedManifestStaticFilesStorage):
+    """
+    Compressed manifest storage that does not hash the files matching skip_patterns.
+
+    The vendor packages ship source maps next to their minified files. They are
+    only fetched by the browser dev tools using their original name, so hashing
+    and copying them is wasted work during collectstatic. They are still
+    compressed under their original name.
+    """
+
+    skip_patterns = ['*.map']
+
+    def post_process(self, paths, dry_run=False, **options):
+        skipped = set(path for path in paths if matches_patterns(path, self.skip_patterns))
+        paths = OrderedDict((path, value) for path, value in paths.items() if path not in skipped)
+        yield from super(SkipSourceMapsManifestStorage, self).post_process(paths, dry_run=dry_run, **options)
+        if not dry_run:
+            yield from self.post_process_with_compression((path, None, False) for path in skipped)
@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.contrib.staticfiles.management.commands import collectstatic
+
+
+class Command(collectstatic.Command):
+    """
+    collectstatic that also skips the files matching COLLECTSTATIC_IGNORE_PATTERNS
+    """
+
+    def set_options(self, **options):
+        super(Command, self).set_options(**options)
+        self.ignore_patterns = list(set(self.ignore_patterns + list(settings.COLLECTSTATIC_IGNORE_PATTERNS)))
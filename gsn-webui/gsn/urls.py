@@ -20,5 +20,4 @@ urlpatterns = [
     url(r'^dashboard/(?P<sensor_name>(\w)+)/$', views.dashboard, name='dashboard'),
 
     # url(r'^logged/$', views.oauth_after_log, name='oauth_after_log'),
-    url(r'^accounts/', include('allaccess.urls')),
 ]
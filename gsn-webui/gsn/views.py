@@ -1,11 +1,13 @@
 import csv
 import json
 from datetime import datetime, timedelta
+import pytz
 import requests
 import re
 from django.conf import settings
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.http import HttpResponse, JsonResponse, HttpResponseRedirect, HttpResponseNotFound
 from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
@@ -27,6 +29,8 @@ oauth_token_url = settings.GSN['SERVICE_URL_LOCAL'] + "oauth2/token"
 oauth_user_url = settings.GSN['SERVICE_URL_LOCAL'] + "api/user"
 api_websocket = re.sub(r"http(s)?://", "ws://", settings.GSN['SERVICE_URL_PUBLIC'])
 max_query_size = settings.GSN['MAX_QUERY_SIZE']
+sensors_cache_timeout = settings.GSN.get('SENSORS_CACHE_TIMEOUT', 30)
+display_timezone = pytz.timezone(settings.GSN.get('DISPLAY_TIME_ZONE', 'CET'))
 
 
 # Views
@@ -57,7 +61,7 @@ def index(request):
 
 def sensors(request):
     """
-    Return the list of sensors as gotten from the GSN server
+    Return the list of sensors as gotten from the GSN server, reusing it for sensors_cache_timeout seconds
     """
 
     payload = {
@@ -65,10 +69,22 @@ def sensors(request):
     }
 
     if request.user.is_authenticated():
-        return JsonResponse(
-            json.loads(requests.get(oauth_sensors_url, params=payload, headers=create_headers(request.user)).text))
+        cache_key = 'sensors:user:%s' % request.user.pk
     else:
-        return JsonResponse(json.loads(requests.get(oauth_sensors_url).text))
+        cache_key = 'sensors:public'
+
+    data = cache.get(cache_key)
+
+    if data is None:
+        if request.user.is_authenticated():
+            r = requests.get(oauth_sensors_url, params=payload, headers=create_headers(request.user))
+        else:
+            r = requests.get(oauth_sensors_url)
+        data = json.loads(r.text)
+        if r.status_code == 200:
+            cache.set(cache_key, data, sensors_cache_timeout)
+
+    return JsonResponse(data)
 
 
 @login_required
@@ -93,7 +109,7 @@ def dashboard(request, sensor_name):
             'fields': sensor_data['properties']['fields']
         }
 
-        data['values'][0] = datetime.fromtimestamp(data['values'][0] / 1000).isoformat(sep='T')
+        data['values'][0] = display_time(data['values'][0])
 
         return JsonResponse(data)
 
@@ -382,8 +398,7 @@ def get_or_create_user(code):
 
 def add_time(data):
     for idx, values in enumerate(data['properties']['values']):
-        d = datetime.fromtimestamp(values[0] / 1000)
-        data['properties']['values'][idx].insert(0, d.isoformat('T'))
+        data['properties']['values'][idx].insert(0, display_time(values[0]))
 
     data['properties']['fields'].insert(0, {
         "unit": "",
@@ -392,3 +407,10 @@ def add_time(data):
     })
 
     return data
+
+
+def display_time(timestamp):
+    """
+    Converts a GSN timestamp in milliseconds to an iso8601 string in the display time zone
+    """
+    return datetime.fromtimestamp(timestamp / 1000, display_timezone).replace(tzinfo=None).isoformat('T')
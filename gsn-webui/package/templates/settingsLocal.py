@@ -3,7 +3,8 @@
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': '/tmp/gsn-webui.sqlite3', },
+        'NAME': '/tmp/gsn-webui.sqlite3',
+        'CONN_MAX_AGE': 60, },
 #     'default': {
 #        'ENGINE': 'django.db.backends.', # Add 'postgresql_psycopg2', 'mysql', 'sqlite3' or 'oracle'.
 #        'NAME': '',                      # Or path to database file if using sqlite3.
@@ -11,9 +12,29 @@ DATABASES = {
 #        'PASSWORD': '',                  # Not used with sqlite3.
 #        'HOST': '',                      # Set to empty string for localhost. Not used with sqlite3.
 #        'PORT': '',                      # Set to empty string for default. Not used with sqlite3.
+#        'CONN_MAX_AGE': 60,              # Seconds a connection is kept open between requests.
+#        'OPTIONS': {'connect_timeout': 2},  # postgresql only.
 #    },
 }
 
+# See https://docs.djangoproject.com/en/1.8/topics/cache/
+
+# CACHES = {
+#     'default': {
+#         'BACKEND': 'django.core.cache.backends.memcached.MemcachedCache',
+#         'LOCATION': '127.0.0.1:11211',
+#         'KEY_PREFIX': 'gsn',
+#     }
+# }
+
+# With a cache shared by all workers, sessions can be read from it instead of
+# the database. Don't enable it with the default per-process local memory cache:
+# a logout in one worker would not evict the session from the others.
+# SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# collected static files, as shipped by the package and served by nginx
+STATIC_ROOT = '/usr/share/gsn-webui/static/static/'
+
 GSN = {
     'CLIENT_ID': 'web-gui-public',
     'CLIENT_SECRET': 'web-gui-secret',
@@ -21,5 +42,7 @@ GSN = {
     'SERVICE_URL_LOCAL': 'http://localhost:9000/ws/',  # used for on-server direct calls
     'WEBUI_URL': 'http://127.0.0.1:8000/',             # used for in-browser redirects
     'MAX_QUERY_SIZE': 5000,
+    'SENSORS_CACHE_TIMEOUT': 30,                       # seconds the sensors list is reused
+    'DISPLAY_TIME_ZONE': 'CET',                        # time zone of the dates sent to the browser
 }
 
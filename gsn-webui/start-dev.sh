@@ -3,8 +3,8 @@ cd gsn-webui
 [ -d env3 ] || virtualenv -p python3 env3
 source env3/bin/activate
 pip install -r requirements.txt
-python manage.py bower install
+bower install
 python manage.py migrate
-python manage.py runserver
+DJANGO_DEBUG=true python manage.py runserver
 deactivate
 cd ..
@@ -1,8 +1,11 @@
 #!/bin/bash
+# stop here if a step fails, gunicorn would only answer errors without the collected static files
+set -e
 [ -d env3 ] || virtualenv -p python3 env3
 source env3/bin/activate
 pip install -r requirements.txt
-python manage.py bower install
+bower install
 python manage.py migrate
+python manage.py collectstatic --noinput -v 0
 gunicorn app.wsgi
 deactivate
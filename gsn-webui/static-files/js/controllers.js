@@ -60,7 +60,7 @@ gsnControllers.service('favoritesService', function ($http) {
 gsnControllers.factory('sensorService', function ($http) {
     return {
         async: function () {
-            return $http.get('sensors');
+            return $http.get('sensors/');
         }
     };
 });
@@ -725,7 +725,7 @@ gsnControllers.controller('DashboardCtrl', ['$scope', '$http', '$interval', 'fav
         favoritesService.list().success(function (data, status, headers, config) {
 
             data.favorites_list.forEach(function (sensor_name) {
-                $http.get('dashboard/' + sensor_name).success(function (data, status, headers, config) {
+                $http.get('dashboard/' + sensor_name + '/').success(function (data, status, headers, config) {
                     $scope.sensors[sensor_name] = data
                     $scope.SensorDataStream.register(sensor_name.toLowerCase(), function (data){
                         if (data) {